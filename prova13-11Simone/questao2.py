@@ -5,6 +5,106 @@ Simulador de Caixa Eletrônico
 Programa que simula um caixa eletrônico com saque de notas de 10, 20 e 50 reais.
 """
 
+import sys
+
+
+# Notas disponíveis no caixa, da maior para a menor
+NOTAS_DISPONIVEIS = (50, 20, 10)
+
+
+class ComposicaoNotas:
+    """
+    Quantidade de cada nota de um saque de um ``LoteNotas``.
+    
+    Ocupa menos memória que um dicionário e pode ser lida como um mapeamento
+    (``composicao[50]``, ``composicao.items()``), mas não é um ``dict``: não
+    aceita atribuição, ``copy()`` nem ``|`` e não é serializável por ``json``.
+    Use ``dict(composicao)`` quando precisar de um dicionário.
+    """
+    
+    __slots__ = ('notas', 'quantidades')
+    
+    def __init__(self, notas, quantidades):
+        self.notas = notas
+        self.quantidades = quantidades
+    
+    def __getitem__(self, nota):
+        try:
+            return self.quantidades[self.notas.index(nota)]
+        except ValueError:
+            raise KeyError(nota) from None
+    
+    def __iter__(self):
+        return iter(self.notas)
+    
+    def __len__(self):
+        return len(self.notas)
+    
+    def __contains__(self, nota):
+        return nota in self.notas
+    
+    def __eq__(self, outro):
+        if isinstance(outro, (dict, ComposicaoNotas)):
+            return dict(self) == dict(outro)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def keys(self):
+        return self.notas
+    
+    def values(self):
+        return self.quantidades
+    
+    def items(self):
+        return tuple(zip(self.notas, self.quantidades))
+    
+    def get(self, nota, padrao=None):
+        return self[nota] if nota in self.notas else padrao
+    
+    def __repr__(self):
+        return f"ComposicaoNotas({dict(self)!r})"
+
+
+class LoteNotas:
+    """
+    Resultado de vários saques guardado em colunas (uma por nota).
+    
+    Cada coluna é um ``array`` de inteiros de 64 bits, evitando um objeto por
+    saque; se algum valor não couber em 64 bits, as colunas passam a ser listas.
+    ``lote[i]`` devolve a ``ComposicaoNotas`` do i-ésimo valor e
+    ``lote[i:j]`` devolve um novo ``LoteNotas`` com esse trecho.
+    """
+    
+    __slots__ = ('notas', 'valores', 'colunas')
+    
+    def __init__(self, notas, valores, colunas):
+        self.notas = notas
+        self.valores = valores
+        self.colunas = colunas
+    
+    def __len__(self):
+        return len(self.valores)
+    
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return LoteNotas(self.notas, self.valores[indice],
+                             tuple(coluna[indice] for coluna in self.colunas))
+        return ComposicaoNotas(self.notas, tuple(coluna[indice] for coluna in self.colunas))
+    
+    def coluna(self, nota):
+        """
+        Retorna as quantidades de uma nota para todos os saques do lote.
+        
+        Args:
+            nota (int): valor da nota
+            
+        Returns:
+            array | list: quantidades da nota, na ordem dos valores
+        """
+        return self.colunas[self.notas.index(nota)]
+
+
 def validar_valor(valor):
     """
     Valida se o valor é um múltiplo de 10.
@@ -29,24 +129,59 @@ def calcular_notas(valor):
     Returns:
         dict: dicionário com as quantidades de cada nota
     """
-    notas = {
-        50: 0,
-        20: 0,
-        10: 0
-    }
+    notas = {}
     
-    # Priorizar notas de 50
-    notas[50] = valor // 50
-    valor %= 50
+    for nota in NOTAS_DISPONIVEIS:
+        notas[nota] = valor // nota
+        valor %= nota
     
-    # Depois notas de 20
-    notas[20] = valor // 20
-    valor %= 20
+    return notas
+
+
+def calcular_notas_em_lote(valores):
+    """
+    Calcula as notas de vários saques de uma vez.
     
-    # Finalmente notas de 10
-    notas[10] = valor // 10
+    As contas são feitas coluna a coluna (uma nota por vez sobre todos os
+    valores), o que evita criar um dicionário por saque.
     
-    return notas
+    Args:
+        valores (iterable): valores a sacar (múltiplos de 10)
+        
+    Returns:
+        LoteNotas: quantidades de cada nota, em colunas
+    """
+    valores = list(valores)
+    colunas = []
+    
+    restos = valores
+    for nota in NOTAS_DISPONIVEIS:
+        colunas.append([resto // nota for resto in restos])
+        restos = [resto % nota for resto in restos]
+    
+    # Guardar em arrays de 64 bits; valores maiores continuam em listas
+    from array import array
+    
+    try:
+        valores = array('q', valores)
+        colunas = [array('q', coluna) for coluna in colunas]
+    except OverflowError:
+        pass
+    
+    return LoteNotas(NOTAS_DISPONIVEIS, valores, tuple(colunas))
+
+
+def descrever_notas():
+    """
+    Descreve as notas disponíveis para as mensagens ao usuário.
+    
+    Returns:
+        str: notas em ordem crescente (ex.: "R$ 10, R$ 20 e R$ 50")
+    """
+    descricoes = [f"R$ {nota}" for nota in sorted(NOTAS_DISPONIVEIS)]
+    if len(descricoes) == 1:
+        return descricoes[0]
+    return ", ".join(descricoes[:-1]) + " e " + descricoes[-1]
 
 
 def exibir_resultado(valor_original, notas):
@@ -63,27 +198,76 @@ def exibir_resultado(valor_original, notas):
     print(f"Valor solicitado: R$ {valor_original:.2f}")
     print("\nNotas entregues:")
     
-    if notas[50] > 0:
-        print(f"  • {notas[50]} nota(s) de R$ 50,00 = R$ {notas[50] * 50:.2f}")
-    if notas[20] > 0:
-        print(f"  • {notas[20]} nota(s) de R$ 20,00 = R$ {notas[20] * 20:.2f}")
-    if notas[10] > 0:
-        print(f"  • {notas[10]} nota(s) de R$ 10,00 = R$ {notas[10] * 10:.2f}")
+    for nota, quantidade in notas.items():
+        if quantidade > 0:
+            print(f"  • {quantidade} nota(s) de R$ {nota},00 = R$ {quantidade * nota:.2f}")
     
-    total = (notas[50] * 50) + (notas[20] * 20) + (notas[10] * 10)
-    total_notas = notas[50] + notas[20] + notas[10]
+    total = sum(nota * quantidade for nota, quantidade in notas.items())
+    total_notas = sum(notas.values())
     
     print(f"\nTotal de notas: {total_notas}")
     print(f"Total em dinheiro: R$ {total:.2f}")
     print("="*50 + "\n")
 
 
+def processar_valores(entradas):
+    """
+    Processa vários saques sem interação com o usuário.
+    
+    Usado no modo em lote, em que um único processo atende vários valores
+    e o custo de iniciar o interpretador é pago só uma vez.
+    
+    Args:
+        entradas (iterable): valores a sacar, como texto
+        
+    Returns:
+        int: 0 se todos os saques foram aprovados, 1 caso contrário
+    """
+    codigo = 0
+    
+    for entrada in entradas:
+        try:
+            valor = int(entrada)
+        except ValueError:
+            print(f"❌ ERRO: '{entrada}' não é um número inteiro válido.", file=sys.stderr)
+            codigo = 1
+            continue
+        
+        if not validar_valor(valor):
+            print(f"❌ ERRO: R$ {valor} não é múltiplo de 10 e maior que zero.", file=sys.stderr)
+            codigo = 1
+            continue
+        
+        exibir_resultado(valor, calcular_notas(valor))
+    
+    return codigo
+
+
+def ler_argumentos(argumentos):
+    """
+    Expande os argumentos da linha de comando em valores a sacar.
+    
+    Cada '-' é substituído pelos valores lidos da entrada padrão.
+    
+    Args:
+        argumentos (list): argumentos da linha de comando
+        
+    Yields:
+        str: valores a sacar, como texto
+    """
+    for argumento in argumentos:
+        if argumento == '-':
+            yield from sys.stdin.read().split()
+        else:
+            yield argumento
+
+
 def main():
     """Função principal que executa o simulador de caixa eletrônico."""
     print("\n" + "="*50)
     print(f"{'BEM-VINDO AO CAIXA ELETRÔNICO':^50}")
     print("="*50)
-    print("\nNotas disponíveis: R$ 10, R$ 20 e R$ 50")
+    print(f"\nNotas disponíveis: {descrever_notas()}")
     print("O valor deve ser múltiplo de 10.\n")
     
     while True:
@@ -105,7 +289,7 @@ def main():
                 print(f"{'ERRO: VALOR INVÁLIDO':^50}")
                 print("!"*50)
                 print("O valor deve ser múltiplo de 10 e maior que zero.")
-                print("Notas disponíveis: R$ 10, R$ 20 e R$ 50")
+                print(f"Notas disponíveis: {descrever_notas()}")
                 print("!"*50 + "\n")
                 continue
             
@@ -129,4 +313,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(processar_valores(ler_argumentos(sys.argv[1:])))
     main()
@@ -5,6 +5,13 @@ Gerador de Tabuada com Intervalo
 Programa que lê um número inteiro e um intervalo, exibindo a tabuada do número nesse intervalo.
 """
 
+from functools import lru_cache
+
+
+# Maior intervalo (em linhas) guardado no cache de tabuadas
+LIMITE_CACHE_TABUADA = 100
+
+
 def ler_numero():
     """
     Lê um número inteiro do usuário.
@@ -41,6 +48,34 @@ def ler_intervalo():
             print("❌ ERRO: Por favor, digite números inteiros válidos.\n")
 
 
+@lru_cache(maxsize=256)
+def _tabuada_em_cache(numero, inicio, fim):
+    """Tabuada de um intervalo pequeno, guardada em cache."""
+    return tuple((i, numero * i) for i in range(inicio, fim + 1))
+
+
+def gerar_tabuada(numero, inicio, fim):
+    """
+    Gera as linhas da tabuada do número dentro do intervalo.
+    
+    Intervalos de até ``LIMITE_CACHE_TABUADA`` linhas ficam em cache, então
+    pedidos repetidos não refazem as contas (``_tabuada_em_cache.cache_info()``
+    mostra acertos e falhas). Intervalos maiores são gerados sob demanda,
+    sem ocupar memória proporcional ao tamanho do intervalo.
+    
+    Args:
+        numero (int): número para o qual calcular a tabuada
+        inicio (int): início do intervalo
+        fim (int): fim do intervalo
+        
+    Returns:
+        iterable: pares (multiplicador, resultado)
+    """
+    if fim - inicio < LIMITE_CACHE_TABUADA:
+        return _tabuada_em_cache(numero, inicio, fim)
+    return ((i, numero * i) for i in range(inicio, fim + 1))
+
+
 def exibir_tabuada(numero, inicio, fim):
     """
     Exibe a tabuada do número dentro do intervalo especificado.
@@ -55,8 +90,7 @@ def exibir_tabuada(numero, inicio, fim):
     print(f"{'(de ' + str(inicio) + ' a ' + str(fim) + ')':^60}")
     print("="*60 + "\n")
     
-    for i in range(inicio, fim + 1):
-        resultado = numero * i
+    for i, resultado in gerar_tabuada(numero, inicio, fim):
         print(f"{numero:4d} × {i:4d} = {resultado:6d}")
     
     print("\n" + "="*60 + "\n")
@@ -80,8 +114,7 @@ def formatar_tabuada_tabela(numero, inicio, fim):
     print("-"*60)
     
     # Dados
-    for i in range(inicio, fim + 1):
-        resultado = numero * i
+    for i, resultado in gerar_tabuada(numero, inicio, fim):
         print(f"{i:<15} {'×':<3} {numero:<15} {'=':<3} {resultado:<15}")
     
     print("="*60 + "\n")
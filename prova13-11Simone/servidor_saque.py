@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Servidor de Saques
+Serviço local que atende vários terminais ao mesmo tempo, calculando as notas de cada saque em lotes.
+
+Protocolo (uma linha por pedido):
+    <valor>   -> "OK 50:<qtd> 20:<qtd> 10:<qtd>" ou "ERRO <motivo>"
+    metricas  -> "METRICAS chave=valor ..."
+    sair      -> encerra a conexão
+"""
+
+import asyncio
+import sys
+import time
+from collections import deque
+
+from questao2 import calcular_notas_em_lote, validar_valor
+
+
+HOST = "127.0.0.1"
+PORTA = 8765
+TAMANHO_FILA = 1024
+TAMANHO_LOTE = 256
+AMOSTRAS_LATENCIA = 10000
+
+# Maior valor aceito: mantém o lote em colunas compactas de 64 bits
+VALOR_MAXIMO = (1 << 63) - 1
+
+
+class Metricas:
+    """Guarda as últimas latências e profundidades de fila observadas."""
+    
+    __slots__ = ('atendidos', 'latencias', 'profundidades', 'maior_fila')
+    
+    def __init__(self, amostras=AMOSTRAS_LATENCIA):
+        self.atendidos = 0
+        self.latencias = deque(maxlen=amostras)
+        self.profundidades = deque(maxlen=amostras)
+        self.maior_fila = 0
+    
+    def registrar(self, latencia, profundidade):
+        """
+        Registra um pedido atendido.
+        
+        Args:
+            latencia (float): tempo entre a chegada e a resposta, em segundos
+            profundidade (int): pedidos na fila quando o lote foi montado
+        """
+        self.atendidos += 1
+        self.latencias.append(latencia)
+        self.profundidades.append(profundidade)
+        if profundidade > self.maior_fila:
+            self.maior_fila = profundidade
+    
+    def resumo(self):
+        """
+        Resume as métricas coletadas.
+        
+        Returns:
+            dict: pedidos atendidos, latências (ms) e profundidades da fila
+        """
+        latencias = sorted(self.latencias)
+        profundidades = self.profundidades
+        
+        return {
+            'atendidos': self.atendidos,
+            'latencia_p50_ms': percentil(latencias, 50) * 1000,
+            'latencia_p99_ms': percentil(latencias, 99) * 1000,
+            'latencia_max_ms': (latencias[-1] if latencias else 0.0) * 1000,
+            'fila_media': sum(profundidades) / len(profundidades) if profundidades else 0.0,
+            'fila_maxima': self.maior_fila
+        }
+
+
+def percentil(valores_ordenados, p):
+    """
+    Calcula o percentil de uma lista já ordenada.
+    
+    Args:
+        valores_ordenados (list): valores em ordem crescente
+        p (float): percentil desejado (0 a 100)
+    
+    Returns:
+        float: valor do percentil (0.0 se a lista estiver vazia)
+    """
+    if not valores_ordenados:
+        return 0.0
+    indice = min(len(valores_ordenados) - 1, int(len(valores_ordenados) * p / 100))
+    return valores_ordenados[indice]
+
+
+def formatar_notas(notas):
+    """
+    Formata a composição de notas para a resposta do protocolo.
+    
+    Args:
+        notas (ComposicaoNotas): quantidades de cada nota
+    
+    Returns:
+        str: linha de resposta
+    """
+    return "OK " + " ".join(f"{nota}:{quantidade}" for nota, quantidade in notas.items())
+
+
+def formatar_metricas(resumo):
+    """
+    Formata o resumo das métricas para a resposta do protocolo.
+    
+    Args:
+        resumo (dict): resultado de ``Metricas.resumo``
+    
+    Returns:
+        str: linha de resposta
+    """
+    campos = (f"{chave}={valor:.3f}" if isinstance(valor, float) else f"{chave}={valor}"
+              for chave, valor in resumo.items())
+    return "METRICAS " + " ".join(campos)
+
+
+async def processar_fila(fila, metricas):
+    """
+    Retira os pedidos da fila em lotes e calcula as notas de cada um.
+    
+    Se o cálculo de um lote falhar, todos os pedidos dele recebem o erro,
+    para que nenhum terminal fique esperando uma resposta que não virá.
+    
+    Args:
+        fila (asyncio.Queue): pedidos (valor, instante de chegada, futuro)
+        metricas (Metricas): onde registrar as latências
+    """
+    while True:
+        pedidos = [await fila.get()]
+        while len(pedidos) < TAMANHO_LOTE and not fila.empty():
+            pedidos.append(fila.get_nowait())
+        
+        profundidade = fila.qsize() + len(pedidos)
+        try:
+            lote = calcular_notas_em_lote(valor for valor, _, _ in pedidos)
+            
+            agora = time.perf_counter()
+            for indice, (_, chegada, futuro) in enumerate(pedidos):
+                if not futuro.done():
+                    futuro.set_result(lote[indice])
+                metricas.registrar(agora - chegada, profundidade)
+        except Exception as e:
+            for _, _, futuro in pedidos:
+                if not futuro.done():
+                    futuro.set_exception(e)
+
+
+async def supervisionar_fila(fila, metricas):
+    """
+    Mantém o processador da fila rodando, reiniciando-o se ele falhar.
+    
+    Args:
+        fila (asyncio.Queue): fila de pedidos compartilhada
+        metricas (Metricas): métricas do servidor
+    """
+    while True:
+        try:
+            await processar_fila(fila, metricas)
+        except Exception as e:
+            print(f"❌ Processador de saques falhou ({e!r}); reiniciando.", file=sys.stderr)
+
+
+async def atender_terminal(leitor, escritor, fila, metricas):
+    """
+    Atende uma conexão, respondendo a cada linha recebida.
+    
+    Quando a fila está cheia, ``fila.put`` aguarda e o terminal deixa de ser
+    lido até haver espaço (contrapressão). Linhas maiores que o limite do
+    ``StreamReader`` (64 KiB) recebem um erro e encerram a conexão.
+    
+    Args:
+        leitor (asyncio.StreamReader): entrada da conexão
+        escritor (asyncio.StreamWriter): saída da conexão
+        fila (asyncio.Queue): fila de pedidos compartilhada
+        metricas (Metricas): métricas do servidor
+    """
+    loop = asyncio.get_running_loop()
+    
+    try:
+        while True:
+            try:
+                linha = await leitor.readline()
+            except ValueError:
+                escritor.write("ERRO entrada muito longa\n".encode('utf-8'))
+                await escritor.drain()
+                break
+            
+            if not linha:
+                break
+            
+            entrada = linha.decode('utf-8', 'replace').strip()
+            if not entrada:
+                continue
+            
+            if entrada.lower() in ['sair', 'exit', 'q']:
+                break
+            
+            if entrada.lower() == 'metricas':
+                resposta = formatar_metricas(metricas.resumo())
+            else:
+                try:
+                    valor = int(entrada)
+                except ValueError:
+                    resposta = "ERRO entrada inválida"
+                else:
+                    if not validar_valor(valor):
+                        resposta = "ERRO valor deve ser múltiplo de 10 e maior que zero"
+                    elif valor > VALOR_MAXIMO:
+                        resposta = f"ERRO valor deve ser no máximo {VALOR_MAXIMO}"
+                    else:
+                        futuro = loop.create_future()
+                        await fila.put((valor, time.perf_counter(), futuro))
+                        try:
+                            resposta = formatar_notas(await futuro)
+                        except Exception as e:
+                            resposta = f"ERRO falha ao calcular as notas ({type(e).__name__})"
+            
+            escritor.write((resposta + "\n").encode('utf-8'))
+            await escritor.drain()
+    except ConnectionError:
+        pass
+    finally:
+        escritor.close()
+        try:
+            await escritor.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def servir(host=HOST, porta=PORTA, tamanho_fila=TAMANHO_FILA):
+    """
+    Inicia o servidor e atende conexões até ser interrompido.
+    
+    Args:
+        host (str): endereço de escuta
+        porta (int): porta de escuta
+        tamanho_fila (int): máximo de pedidos aguardando processamento
+    """
+    fila = asyncio.Queue(maxsize=tamanho_fila)
+    metricas = Metricas()
+    processador = asyncio.create_task(supervisionar_fila(fila, metricas))
+    
+    servidor = await asyncio.start_server(
+        lambda leitor, escritor: atender_terminal(leitor, escritor, fila, metricas),
+        host, porta
+    )
+    
+    print(f"Servidor de saques ouvindo em {host}:{porta}")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        processador.cancel()
+
+
+def main():
+    """Função principal que executa o servidor de saques."""
+    porta = int(sys.argv[1]) if len(sys.argv) > 1 else PORTA
+    
+    try:
+        asyncio.run(servir(porta=porta))
+    except KeyboardInterrupt:
+        print("\n\nServidor encerrado pelo usuário. Até logo!\n")
+
+
+if __name__ == "__main__":
+    main()
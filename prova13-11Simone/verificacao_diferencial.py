@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Verificação Diferencial
+Programa que compara os caminhos rápidos (lote, cache, registros compactos) com implementações de referência,
+usando entradas aleatórias e casos de fronteira, e informa as divergências e a vazão de cada caminho.
+Funções sem caminho rápido (IMC, calcular_notas, analisar_numeros) são comparadas com suas versões originais
+apenas como proteção contra regressões e aparecem marcadas com '*' no relatório.
+
+Uso: python verificacao_diferencial.py [quantidade_de_casos] [semente]
+"""
+
+import io
+import math
+import random
+import sys
+import time
+
+from analisador_numeros import (analisar_numeros, analisar_numeros_em_lote, converter_numeros,
+                                ler_numeros_em_lote)
+from questao2 import calcular_notas, calcular_notas_em_lote
+from questao3 import calcular_imc, classificar_imc
+from questao4 import gerar_tabuada
+
+
+# Máximo de divergências exibidas por verificação
+MAX_DIVERGENCIAS_EXIBIDAS = 5
+
+
+# ---------------------------------------------------------------------------
+# Implementações de referência (versões escalares originais)
+# ---------------------------------------------------------------------------
+
+def referencia_converter(dados):
+    """
+    Converte ``bytes`` token a token, localizando cada um por varredura simples.
+    
+    Segue a gramática ASCII de ``converter_numeros`` para ``bytes``: separa por
+    espaços ASCII e vírgula e converte cada token com ``int(bytes)``.
+    """
+    separadores = b' \t\n\r\x0b\x0c,'
+    numeros = []
+    erros = []
+    i = 0
+    
+    while i < len(dados):
+        if dados[i] in separadores:
+            i += 1
+            continue
+        inicio = i
+        while i < len(dados) and dados[i] not in separadores:
+            i += 1
+        token = dados[inicio:i]
+        try:
+            numeros.append(int(token))
+        except ValueError:
+            erros.append((inicio, token.decode('utf-8', 'replace')))
+    
+    return numeros, erros
+
+
+def referencia_converter_texto(texto):
+    """
+    Converte ``str`` token a token, como ``int(input().strip())`` em ``ler_numeros``.
+    
+    Separa por espaços Unicode (``str.isspace``) e vírgula; posições em caracteres.
+    """
+    numeros = []
+    erros = []
+    i = 0
+    
+    while i < len(texto):
+        if texto[i].isspace() or texto[i] == ',':
+            i += 1
+            continue
+        inicio = i
+        while i < len(texto) and not (texto[i].isspace() or texto[i] == ','):
+            i += 1
+        token = texto[inicio:i]
+        try:
+            numeros.append(int(token))
+        except ValueError:
+            erros.append((inicio, token))
+    
+    return numeros, erros
+
+
+def referencia_analisar(numeros):
+    """Versão original de ``analisar_numeros``, que devolvia um dicionário."""
+    pares = impares = positivos = negativos = 0
+    
+    for numero in numeros:
+        if numero % 2 == 0:
+            pares += 1
+        else:
+            impares += 1
+        
+        if numero > 0:
+            positivos += 1
+        elif numero < 0:
+            negativos += 1
+    
+    return {
+        'pares': pares,
+        'impares': impares,
+        'positivos': positivos,
+        'negativos': negativos,
+        'maior': max(numeros),
+        'menor': min(numeros),
+        'quantidade': len(numeros)
+    }
+
+
+def referencia_notas(valor):
+    """Versão original de ``calcular_notas``, com as notas fixas no código."""
+    notas = {50: 0, 20: 0, 10: 0}
+    notas[50] = valor // 50
+    valor %= 50
+    notas[20] = valor // 20
+    valor %= 20
+    notas[10] = valor // 10
+    return notas
+
+
+def referencia_imc(peso, altura):
+    """Versão original de ``calcular_imc``."""
+    if altura <= 0 or peso <= 0:
+        return None
+    return peso / (altura * altura)
+
+
+def referencia_classificar(imc):
+    """Versão original de ``classificar_imc``."""
+    if imc < 18.5:
+        return "Abaixo do peso"
+    elif imc < 25.0:
+        return "Peso normal"
+    elif imc < 30.0:
+        return "Sobrepeso"
+    else:
+        return "Obesidade"
+
+
+def referencia_tabuada(numero, inicio, fim):
+    """Tabuada calculada diretamente, como no laço original."""
+    return [(i, numero * i) for i in range(inicio, fim + 1)]
+
+
+def capturar(funcao, *args):
+    """
+    Executa a função e devolve o resultado ou o tipo da exceção lançada.
+    
+    Permite comparar caminhos que devem falhar da mesma forma
+    (por exemplo, ``analisar_numeros([])``).
+    """
+    try:
+        return funcao(*args)
+    except Exception as e:
+        return ('exceção', type(e).__name__)
+
+
+# ---------------------------------------------------------------------------
+# Geração de entradas
+# ---------------------------------------------------------------------------
+
+def gerar_texto(gerador):
+    """
+    Gera um texto com inteiros, separadores variados e alguns tokens inválidos.
+    
+    Inclui dígitos e espaços não ASCII, que são válidos em ``str`` mas não em
+    ``bytes``, para exercitar a diferença entre as duas gramáticas.
+    """
+    separadores = [' ', '  ', '\n', '\r\n', ',', ', ', '\t', ',,', '\x0b', '\x0c', '\xa0', '\u2003']
+    invalidos = ['x1', '1.5', '--2', 'abc', '12a', 'é', '+', '١٢', '٣', '１２']
+    partes = []
+    
+    for _ in range(gerador.randint(0, 200)):
+        if gerador.random() < 0.02:
+            partes.append(gerador.choice(invalidos))
+        else:
+            numero = gerador.choice([0, -1, 1, gerador.randint(-10**6, 10**6),
+                                     gerador.randint(-10**20, 10**20)])
+            partes.append(('+' if numero > 0 and gerador.random() < 0.05 else '') + str(numero))
+        partes.append(gerador.choice(separadores))
+    
+    return ''.join(partes).encode('utf-8')
+
+
+def gerar_lista_numeros(gerador):
+    """Gera uma lista de inteiros com zeros, ímpares negativos e extremos."""
+    return [gerador.choice([0, -1, -3, 1, 2, gerador.randint(-10**9, 10**9)])
+            for _ in range(gerador.randint(1, 50))]
+
+
+def gerar_imcs(quantidade, gerador):
+    """Gera valores de IMC concentrados nas fronteiras da tabela da OMS."""
+    fronteiras = [18.5, 25.0, 30.0]
+    valores = [0.0]
+    for fronteira in fronteiras:
+        valores += [fronteira, math.nextafter(fronteira, 0), math.nextafter(fronteira, math.inf)]
+    valores += [gerador.uniform(5, 60) for _ in range(quantidade)]
+    return valores
+
+
+def gerar_pesos_alturas(quantidade, gerador):
+    """Gera pares (peso, altura) incluindo zeros, negativos e IMCs de fronteira."""
+    pares = [(0, 1.7), (70, 0), (-70, 1.7), (70, -1.7), (0, 0)]
+    for fronteira in [18.5, 25.0, 30.0]:
+        altura = gerador.uniform(1.0, 2.2)
+        pares.append((fronteira * altura * altura, altura))
+    pares += [(gerador.uniform(1, 500), gerador.uniform(0.3, 3)) for _ in range(quantidade)]
+    return pares
+
+
+def gerar_valores_grandes(gerador):
+    """Gera saques em torno de 2**63, onde o lote deixa de caber em 64 bits."""
+    limite = (1 << 63) // 10 * 10
+    valores = [limite - 10, limite, limite + 10, limite + 20, 10**20, (1 << 70) // 10 * 10]
+    valores += [gerador.randint(1, 10**25) * 10 for _ in range(100)]
+    return valores + [10, 80, 130]
+
+
+def gerar_intervalos(quantidade, gerador):
+    """Gera (número, início, fim) com negativos, intervalos unitários, vazios e longos."""
+    intervalos = [(0, 0, 0), (-7, -3, 3), (5, 1, 1), (5, 3, 1)]
+    
+    # Em torno do limite do cache (100 linhas) e intervalos longos, não guardados
+    intervalos += [(3, 1, 99), (3, 1, 100), (3, 1, 101), (-9, -50, 50), (12, -1000, 2500), (7, 1, 5000)]
+    for _ in range(quantidade):
+        inicio = gerador.randint(-100, 100)
+        intervalos.append((gerador.randint(-1000, 1000), inicio, inicio + gerador.randint(0, 50)))
+    return intervalos
+
+
+# ---------------------------------------------------------------------------
+# Comparação
+# ---------------------------------------------------------------------------
+
+def verificar(nome, entradas, rapido, referencia, normalizar=list, regressao=False):
+    """
+    Executa os dois caminhos sobre as mesmas entradas e compara as saídas.
+    
+    Apenas as chamadas são cronometradas; a conversão das saídas do caminho
+    rápido para o formato da referência fica fora da medição.
+    
+    Args:
+        nome (str): nome da verificação
+        entradas (list): entradas a comparar
+        rapido (callable): recebe a lista de entradas e devolve as saídas
+        referencia (callable): recebe a lista de entradas e devolve a lista de saídas
+        normalizar (callable): converte as saídas do caminho rápido em lista
+        regressao (bool): True se não há caminho rápido, apenas a versão atual
+    
+    Returns:
+        dict: casos, divergências e tempos de cada caminho
+    """
+    inicio = time.perf_counter()
+    saidas_rapido = rapido(entradas)
+    tempo_rapido = time.perf_counter() - inicio
+    saidas_rapido = normalizar(saidas_rapido)
+    
+    inicio = time.perf_counter()
+    saidas_referencia = referencia(entradas)
+    tempo_referencia = time.perf_counter() - inicio
+    
+    divergencias = [
+        (entrada, esperado, obtido)
+        for entrada, esperado, obtido in zip(entradas, saidas_referencia, saidas_rapido)
+        if esperado != obtido
+    ]
+    if len(saidas_rapido) != len(saidas_referencia):
+        divergencias.append(('quantidade de saídas', len(saidas_referencia), len(saidas_rapido)))
+    
+    return {
+        'nome': nome,
+        'casos': len(entradas),
+        'divergencias': divergencias,
+        'tempo_rapido': tempo_rapido,
+        'tempo_referencia': tempo_referencia,
+        'regressao': regressao
+    }
+
+
+def executar_verificacoes(quantidade, semente):
+    """
+    Executa todas as verificações diferenciais.
+    
+    Args:
+        quantidade (int): quantidade de casos aleatórios por verificação
+        semente (int): semente do gerador aleatório
+    
+    Returns:
+        list: resultados de ``verificar``
+    """
+    gerador = random.Random(semente)
+    resultados = []
+    
+    # Conversão de texto; em ler_numeros_em_lote os blocos são minúsculos para
+    # forçar tokens divididos entre blocos, então sua vazão aqui não é representativa
+    textos = [b'', b' , \n', b'1', b'-0', b'7 x 8', b'1\x0b2\x0c3', '١٢ 3'.encode('utf-8'),
+              '1\xa02'.encode('utf-8')] + [gerar_texto(gerador) for _ in range(quantidade // 10)]
+    tamanhos_bloco = [gerador.randint(1, 64) for _ in textos]
+    resultados.append(verificar(
+        "converter_numeros/bytes",
+        textos,
+        lambda lote: [converter_numeros(texto) for texto in lote],
+        lambda lote: [referencia_converter(texto) for texto in lote]
+    ))
+    
+    # Os mesmos textos como str: aceita dígitos e espaços Unicode, como ler_numeros
+    textos_str = [texto.decode('utf-8') for texto in textos]
+    resultados.append(verificar(
+        "converter_numeros/str",
+        textos_str,
+        lambda lote: [converter_numeros(texto) for texto in lote],
+        lambda lote: [referencia_converter_texto(texto) for texto in lote]
+    ))
+    resultados.append(verificar(
+        "ler_numeros_em_lote",
+        textos,
+        lambda lote: [ler_numeros_em_lote(io.BytesIO(texto), tamanho_bloco=tamanho)
+                      for texto, tamanho in zip(lote, tamanhos_bloco)],
+        lambda lote: [referencia_converter(texto) for texto in lote]
+    ))
+    
+    # Análise dos números; a lista vazia deve falhar da mesma forma
+    listas = [[0], [-1], [-3, -5, 7]] + [gerar_lista_numeros(gerador) for _ in range(quantidade // 10)]
+    resultados.append(verificar(
+        "analisar_numeros_em_lote",
+        listas,
+        analisar_numeros_em_lote,
+        lambda lote: [referencia_analisar(numeros) for numeros in lote],
+        lambda saidas: [dict(saida) for saida in saidas]
+    ))
+    resultados.append(verificar(
+        "analisar_numeros",
+        [[]] + listas,
+        lambda lote: [capturar(analisar_numeros, numeros) for numeros in lote],
+        lambda lote: [capturar(referencia_analisar, numeros) for numeros in lote],
+        regressao=True
+    ))
+    
+    # Notas
+    valores = [10, 20, 30, 40, 50, 60, 80, 90] + [gerador.randint(1, 100) * 10 for _ in range(quantidade)]
+    valores += [gerador.randint(1, 10**8) * 10 for _ in range(quantidade // 10)]
+    resultados.append(verificar(
+        "calcular_notas",
+        valores,
+        lambda lote: [calcular_notas(valor) for valor in lote],
+        lambda lote: [referencia_notas(valor) for valor in lote],
+        regressao=True
+    ))
+    resultados.append(verificar(
+        "calcular_notas_em_lote",
+        valores,
+        lambda lote: capturar(calcular_notas_em_lote, lote),
+        lambda lote: [referencia_notas(valor) for valor in lote],
+        lambda lote: normalizar_lote(lote, len(valores))
+    ))
+    
+    # Notas: valores que não cabem em 64 bits
+    valores_grandes = gerar_valores_grandes(gerador)
+    resultados.append(verificar(
+        "notas_em_lote (>64 bits)",
+        valores_grandes,
+        lambda lote: capturar(calcular_notas_em_lote, lote),
+        lambda lote: [referencia_notas(valor) for valor in lote],
+        lambda lote: normalizar_lote(lote, len(valores_grandes))
+    ))
+    
+    # IMC (sem caminho rápido): fronteiras 18,5 / 25,0 / 30,0 e entradas não positivas
+    resultados.append(verificar(
+        "calcular_imc",
+        gerar_pesos_alturas(quantidade, gerador),
+        lambda lote: [calcular_imc(peso, altura) for peso, altura in lote],
+        lambda lote: [referencia_imc(peso, altura) for peso, altura in lote],
+        regressao=True
+    ))
+    resultados.append(verificar(
+        "classificar_imc",
+        gerar_imcs(quantidade, gerador),
+        lambda lote: [classificar_imc(imc) for imc in lote],
+        lambda lote: [referencia_classificar(imc) for imc in lote],
+        regressao=True
+    ))
+    
+    # Tabuada: intervalos repetidos exercitam o cache
+    intervalos = gerar_intervalos(quantidade // 10, gerador)
+    intervalos += intervalos[:len(intervalos) // 2]
+    resultados.append(verificar(
+        "gerar_tabuada",
+        intervalos,
+        lambda lote: [gerar_tabuada(*intervalo) for intervalo in lote],
+        lambda lote: [referencia_tabuada(*intervalo) for intervalo in lote],
+        lambda saidas: [list(saida) for saida in saidas]
+    ))
+    
+    return resultados
+
+
+def normalizar_lote(lote, quantidade):
+    """
+    Converte um ``LoteNotas`` em lista de dicionários.
+    
+    Se o lote falhou (resultado de ``capturar``), repete a falha para cada
+    valor, de modo que todos apareçam como divergências.
+    """
+    if isinstance(lote, tuple):
+        return [lote] * quantidade
+    return [dict(lote[indice]) for indice in range(len(lote))]
+
+
+def exibir_relatorio(resultados):
+    """
+    Exibe o relatório das verificações de forma formatada.
+    
+    Args:
+        resultados (list): resultados de ``verificar``
+    """
+    print("\n" + "="*78)
+    print(f"{'VERIFICAÇÃO DIFERENCIAL':^78}")
+    print("="*78)
+    print(f"{'Verificação':<24} {'Casos':>8} {'Diverg.':>8} {'Rápido (casos/s)':>17} {'Referência (casos/s)':>19}")
+    print("-"*78)
+    
+    for resultado in resultados:
+        vazao_rapido = resultado['casos'] / resultado['tempo_rapido'] if resultado['tempo_rapido'] else 0
+        vazao_referencia = resultado['casos'] / resultado['tempo_referencia'] if resultado['tempo_referencia'] else 0
+        nome = resultado['nome'] + ('*' if resultado['regressao'] else '')
+        print(f"{nome:<24} {resultado['casos']:>8} {len(resultado['divergencias']):>8} "
+              f"{vazao_rapido:>17,.0f} {vazao_referencia:>19,.0f}")
+    
+    print("="*78)
+    print("* sem caminho rápido: compara a versão atual com a original (proteção contra regressões)")
+    
+    for resultado in resultados:
+        if not resultado['divergencias']:
+            continue
+        print(f"\n❌ Divergências em {resultado['nome']}:")
+        for entrada, esperado, obtido in resultado['divergencias'][:MAX_DIVERGENCIAS_EXIBIDAS]:
+            print(f"  • entrada:  {entrada!r}")
+            print(f"    esperado: {esperado!r}")
+            print(f"    obtido:   {obtido!r}")
+    
+    print()
+
+
+def main():
+    """Função principal que executa a verificação diferencial."""
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    semente = int(sys.argv[2]) if len(sys.argv) > 2 else random.randrange(2**32)
+    
+    print(f"\nSemente: {semente} (use-a para reproduzir esta execução)")
+    
+    resultados = executar_verificacoes(quantidade, semente)
+    exibir_relatorio(resultados)
+    
+    if any(resultado['divergencias'] for resultado in resultados):
+        print("❌ Foram encontradas divergências.\n")
+        return 1
+    
+    print("✅ Todos os caminhos rápidos coincidem com as referências.\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())